@@ -1,22 +1,25 @@
-import inspect
 import os
 
 from contextlib import contextmanager
 from pathlib import Path
 
-test_dir = Path(__file__).parents[0]
+try:
+    # Python >= 3.11
+    from contextlib import chdir as pushd
+except ImportError:
+    @contextmanager
+    def pushd(dir):
+        """
+        Change the current working directory within a context.
+        """
+        prevdir = os.getcwd()
+        os.chdir(dir)
+        try:
+            yield
+        finally:
+            os.chdir(prevdir)
 
-@contextmanager
-def pushd(dir):
-    """
-    Change the current working directory within a context.
-    """
-    prevdir = os.getcwd()
-    os.chdir(dir)
-    yield
-    os.chdir(prevdir)
 
-
-TEST_DIR = test_dir.absolute()
-DATA_DIR = os.path.join(TEST_DIR, "data")
-GEOM_DIR = os.path.join(TEST_DIR, 'test_geom')
+TEST_DIR = Path(__file__).parent.absolute()
+DATA_DIR = TEST_DIR / 'data'
+GEOM_DIR = TEST_DIR / 'test_geom'
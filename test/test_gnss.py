@@ -1,6 +1,8 @@
 import datetime
+import gzip
 import os
 import pytest
+import zipfile
 
 import numpy as np
 import pandas as pd
@@ -8,6 +10,9 @@ import pandas as pd
 from datetime import time
 from test import TEST_DIR, pushd
 
+import RAiDER.downloadGNSSDelays
+from RAiDER.downloadGNSSDelays import download_tropo_delays
+from RAiDER.getStationDelays import get_delays_UNR
 from RAiDER.gnss.processDelayFiles import (
     addDateTimeToFiles,
     getDateTime,
@@ -35,6 +40,109 @@ def temp_file():
     return df
 
 
+@pytest.fixture
+def unr_zip(tmp_path):
+    '''
+    Build a UNR-style station zip holding a single gzipped tropo SINEX file
+    for 2020-01-01, with one TROP/SOLUTION row for each epoch (seconds of day)
+    '''
+    def _make(epochs, trailer=()):
+        lines = [
+            '%=TRO 0.01 NGL 20:002:00000 NGL 20:001:00000 20:001:86100 P MIX',
+            '+TROP/SOLUTION',
+            '*SITE ____EPOCH___ TROTOT STDDEV TROWET TGETOT STDDEV TGNTOT STDDEV WVAPOR STDDEV MTEMP',
+        ]
+        for t in epochs:
+            # ZTD = 2400 + k mm and wet = 100 + k mm, so the hydrostatic delay
+            # is a constant 2300 mm and all three delays differ
+            k = t // 300
+            lines.append(
+                ' ABCD 20:001:{:05d} {:.1f} 1.0 {:.1f} 0.1 0.01 0.2 0.01 15.0 0.5 280.0'
+                .format(t, 2400. + k, 100. + k)
+            )
+        lines.append('-TROP/SOLUTION')
+        lines.extend(trailer)
+
+        zip_path = str(tmp_path / 'ABCD.2020.trop.zip')
+        with zipfile.ZipFile(zip_path, 'w') as z:
+            z.writestr(
+                'ABCD.2020.001.trop.gz',
+                gzip.compress('\n'.join(lines).encode('utf-8'))
+            )
+        return zip_path
+
+    return _make
+
+
+def test_get_delays_UNR_fills_missing_epochs(tmp_path, unr_zip):
+    true_times = np.arange(0, 86400, 300)
+    missing = np.isin(true_times, [0, 600, 43200, 86100])
+    stationFile = unr_zip(true_times[~missing])
+    out_name = str(tmp_path / 'ABCD_ztd.csv')
+
+    get_delays_UNR(stationFile, out_name, ['2020-01-01'])
+
+    df = pd.read_csv(out_name)
+    assert np.array_equal(df['times'], true_times)
+    for col in ['ZTD', 'wet_delay', 'hydrostatic_delay', 'sigZTD']:
+        assert np.array_equal(df[col].isna(), missing)
+
+    valid = df[~missing]
+    k = true_times[~missing] // 300
+    assert np.allclose(valid['ZTD'], (2400. + k) * 0.001)
+    assert np.allclose(valid['wet_delay'], (100. + k) * 0.001)
+    assert np.allclose(valid['hydrostatic_delay'], 2.3)
+    assert np.allclose(valid['sigZTD'], 0.001)
+
+
+def test_get_delays_UNR_reads_solution_block_only(tmp_path, unr_zip):
+    true_times = np.arange(0, 86400, 300)
+    trailer = [
+        '*SITE lines after the block are not data',
+        ' ABCD 20:001:00000 9999.0 9.0 999.0 0.1 0.01 0.2 0.01 15.0 0.5 280.0',
+        '%=ENDTRO',
+    ]
+    stationFile = unr_zip(true_times, trailer=trailer)
+    out_name = str(tmp_path / 'ABCD_ztd.csv')
+
+    get_delays_UNR(stationFile, out_name, ['2020-01-01'])
+
+    df = pd.read_csv(out_name)
+    k = true_times // 300
+    assert df.shape[0] == 288
+    assert (df['ID'] == 'ABCD').all()
+    assert np.array_equal(df['times'], true_times)
+    assert np.allclose(df['ZTD'], (2400. + k) * 0.001)
+    assert np.allclose(df['wet_delay'], (100. + k) * 0.001)
+    assert np.allclose(df['hydrostatic_delay'], 2.3)
+    assert np.allclose(df['sigZTD'], 0.001)
+
+
+def test_get_delays_UNR_skips_other_dates(tmp_path, unr_zip):
+    stationFile = unr_zip(np.arange(0, 86400, 300))
+    out_name = str(tmp_path / 'ABCD_ztd.csv')
+
+    get_delays_UNR(stationFile, out_name, ['2020-01-02'])
+
+    assert not os.path.exists(out_name)
+
+
+def test_download_tropo_delays_dedupes(tmp_path, monkeypatch):
+    calls = []
+
+    def fake_download_UNR(statID, year, writeDir='.', download=False):
+        calls.append((statID, year, writeDir, download))
+        return {'ID': statID, 'year': year, 'path': 'url'}
+
+    monkeypatch.setattr(RAiDER.downloadGNSSDelays, 'download_UNR', fake_download_UNR)
+
+    download_tropo_delays('ABCD', [2020, 2020], gps_repo='UNR', writeDir=str(tmp_path), numCPUs=2)
+
+    assert calls == [('ABCD', 2020, str(tmp_path), False)]
+    df = pd.read_csv(os.path.join(str(tmp_path), 'UNRgnssStationList_overbbox_withpaths.csv'))
+    assert len(df) == 1
+
+
 def test_getDateTime():
     f1 = '20080101T060000'
     f2 = '20080101T560000'
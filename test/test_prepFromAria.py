@@ -0,0 +1,57 @@
+import pytest
+
+import numpy as np
+
+from osgeo import gdal, osr
+
+from RAiDER.prepFromAria import makeLatLonGrid
+from RAiDER.utilFcns import gdal_open
+
+
+@pytest.fixture
+def geocoded_file(tmp_path):
+    '''
+    A small geocoded raster whose pixel grid crosses both the equator
+    and the prime meridian
+    '''
+    xSize, ySize = 9, 6
+    gt = (-1.0, 0.25, 0., 1.0, 0., -0.25)
+    filename = str(tmp_path / 'inc.tif')
+
+    srs = osr.SpatialReference()
+    srs.ImportFromEPSG(4326)
+
+    ds = gdal.GetDriverByName('GTiff').Create(filename, xSize, ySize, 1, gdal.GDT_Float32)
+    ds.SetGeoTransform(gt)
+    ds.SetProjection(srs.ExportToWkt())
+    ds.GetRasterBand(1).WriteArray(np.ones((ySize, xSize), dtype=np.float32))
+    ds = None
+
+    return filename, xSize, ySize, gt
+
+
+def test_makeLatLonGrid(tmp_path, geocoded_file):
+    inFile, xSize, ySize, gt = geocoded_file
+    lonFile = str(tmp_path / 'lon.rdr')
+    latFile = str(tmp_path / 'lat.rdr')
+
+    makeLatLonGrid(inFile, lonFile, latFile)
+
+    lons = gdal_open(lonFile)
+    lats = gdal_open(latFile)
+
+    assert lons.shape == (ySize, xSize)
+    assert lats.shape == (ySize, xSize)
+
+    # the grid holds the upper-left corners of the input pixels (the
+    # geotransform origin is the outer corner of the first pixel), so the
+    # last column/row is the corner of the last pixel
+    assert np.allclose(lons[:, -1], gt[0] + gt[1] * (xSize - 1))
+    assert np.allclose(lats[-1, :], gt[3] + gt[5] * (ySize - 1))
+    assert np.allclose(lons[0, :], gt[0] + gt[1] * np.arange(xSize))
+    assert np.allclose(lats[:, 0], gt[3] + gt[5] * np.arange(ySize))
+
+    # pixels on the equator / prime meridian are valid coordinates
+    assert np.any(lons == 0) and np.any(lats == 0)
+    assert np.all(np.isfinite(lons))
+    assert np.all(np.isfinite(lats))
@@ -0,0 +1,172 @@
+import datetime
+import sys
+import pytest
+import requests
+
+import RAiDER.runProgram
+from RAiDER.runProgram import parseCMD
+
+TIMES = [datetime.datetime(2020, 1, d, 0, 0, 0) for d in range(1, 5)]
+WET_NAMES = ['ERA5_wet_2020010{}.tif'.format(d) for d in range(1, 5)]
+HYDRO_NAMES = ['ERA5_hydro_2020010{}.tif'.format(d) for d in range(1, 5)]
+
+
+@pytest.fixture
+def run_parseCMD(monkeypatch):
+    '''
+    Run parseCMD with checkArgs, the process pool and _tropo_delay replaced.
+    With worker=True the pool runs the real download worker in-process.
+    Returns the argument chunks given to the pool and to the serial loop.
+    '''
+    def _run(parallel, download_only, failed=(), worker=False, weather_model=None):
+        outArgs = {
+            'verbose': 0,
+            'parallel': parallel,
+            'download_only': download_only,
+            'times': TIMES,
+            'wetFilenames': WET_NAMES,
+            'hydroFilenames': HYDRO_NAMES,
+            'weather_model': weather_model,
+        }
+        pooled, serial = [], []
+
+        class FakePool(object):
+            def __init__(self, nprocs):
+                pass
+
+            def __enter__(self):
+                return self
+
+            def __exit__(self, *exc):
+                return False
+
+            def map(self, func, lst):
+                pooled.extend(lst)
+                if worker:
+                    return [func(a) for a in lst]
+                return [[t for t in a['times'] if t in failed] for a in lst]
+
+        def fake_tropo_delay(args):
+            serial.append(args)
+            return []
+
+        monkeypatch.setattr(
+            sys, 'argv',
+            ['raiderDelay.py', '--date', '20200101', '20200104', '--time', '00:00:00',
+             '--bbox', '10', '11', '-80', '-79']
+        )
+        monkeypatch.setattr('RAiDER.checkArgs.checkArgs', lambda args, p: outArgs)
+        monkeypatch.setattr(RAiDER.runProgram.multiprocessing, 'Pool', FakePool)
+        monkeypatch.setattr(RAiDER.runProgram, '_tropo_delay', fake_tropo_delay)
+
+        parseCMD()
+        return pooled, serial
+
+    return _run
+
+
+def _all(chunks, key):
+    return [v for a in chunks for v in a[key]]
+
+
+def test_parseCMD_serial(run_parseCMD):
+    pooled, serial = run_parseCMD(parallel=1, download_only=False)
+
+    assert pooled == []
+    assert len(serial) == 1
+    assert serial[0]['times'] == TIMES
+    assert serial[0]['download_only'] is False
+
+
+def test_parseCMD_parallel_downloads_then_computes(run_parseCMD):
+    pooled, serial = run_parseCMD(parallel=2, download_only=False)
+
+    # the pool only downloads, for every date
+    assert len(pooled) == 2
+    assert all(a['download_only'] is True for a in pooled)
+    assert _all(pooled, 'times') == TIMES
+
+    # the delays are computed serially with the original arguments
+    assert len(serial) == 2
+    assert all(a['download_only'] is False for a in serial)
+    assert _all(serial, 'times') == TIMES
+    assert _all(serial, 'wetFilenames') == WET_NAMES
+    assert _all(serial, 'hydroFilenames') == HYDRO_NAMES
+
+
+def test_parseCMD_parallel_download_only(run_parseCMD):
+    pooled, serial = run_parseCMD(parallel=2, download_only=True)
+
+    assert _all(pooled, 'times') == TIMES
+    assert all(a['download_only'] is True for a in pooled)
+    assert serial == []
+
+
+def test_parseCMD_parallel_skips_failed_downloads(run_parseCMD):
+    pooled, serial = run_parseCMD(parallel=2, download_only=False, failed={TIMES[1]})
+
+    assert _all(pooled, 'times') == TIMES
+    assert _all(serial, 'times') == [TIMES[0]] + TIMES[2:]
+    assert _all(serial, 'wetFilenames') == [WET_NAMES[0]] + WET_NAMES[2:]
+    assert _all(serial, 'hydroFilenames') == [HYDRO_NAMES[0]] + HYDRO_NAMES[2:]
+
+
+def test_tropo_delay_returns_failed_dates(monkeypatch):
+    def fake_tropo_delay(args):
+        if args['times'] == TIMES[1]:
+            raise RuntimeError('download failed')
+        return None, None
+
+    monkeypatch.setattr('RAiDER.delay.tropo_delay', fake_tropo_delay)
+
+    args = {'times': TIMES, 'wetFilenames': WET_NAMES, 'hydroFilenames': HYDRO_NAMES}
+    assert RAiDER.runProgram._tropo_delay(args) == [TIMES[1]]
+
+
+class FakeWeatherModel(object):
+    def __init__(self):
+        self.files = None
+
+
+@pytest.fixture
+def fake_download(tmp_path, monkeypatch):
+    '''
+    Replace tropo_delay with a download that raises for some dates and
+    silently writes nothing for others, like the ECMWF models do
+    '''
+    def _setup(raising=(), swallowed=()):
+        weather_model = {'type': FakeWeatherModel(), 'files': None, 'name': 'ERA5'}
+
+        def fake_tropo_delay(args):
+            assert args['download_only'] is True
+            tim = args['times']
+            wm_file = str(tmp_path / 'ERA5_{}.nc'.format(tim.strftime('%Y%m%d')))
+            args['weather_model']['type'].files = [wm_file]
+            if tim in raising:
+                raise requests.exceptions.ConnectionError('connection refused')
+            if tim not in swallowed:
+                open(wm_file, 'w').close()
+            return None, None
+
+        monkeypatch.setattr('RAiDER.delay.tropo_delay', fake_tropo_delay)
+        return weather_model
+
+    return _setup
+
+
+def test_download_weather_models_returns_failed_dates(fake_download):
+    weather_model = fake_download(raising={TIMES[1]}, swallowed={TIMES[3]})
+    args = {'times': TIMES, 'download_only': False, 'weather_model': weather_model}
+
+    assert RAiDER.runProgram._download_weather_models(args) == [TIMES[1], TIMES[3]]
+
+
+def test_parseCMD_parallel_survives_download_errors(run_parseCMD, fake_download):
+    weather_model = fake_download(raising={TIMES[0]}, swallowed={TIMES[2]})
+    pooled, serial = run_parseCMD(
+        parallel=2, download_only=False, worker=True, weather_model=weather_model
+    )
+
+    assert _all(pooled, 'times') == TIMES
+    assert _all(serial, 'times') == [TIMES[1], TIMES[3]]
+    assert _all(serial, 'wetFilenames') == [WET_NAMES[1], WET_NAMES[3]]
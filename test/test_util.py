@@ -10,8 +10,8 @@ from test import TEST_DIR
 from osgeo import gdal, osr
 
 from RAiDER.utilFcns import (
-    _least_nonzero, cosd, gdal_open, makeDelayFileNames, sind,
-    writeArrayToRaster, writeResultsToHDF5, gdal_extents, modelName2Module,
+    _least_nonzero, cosd, gdal_open, makeDelayFileNames, makeHeightLevelFileName,
+    sind, writeArrayToRaster, writeResultsToHDF5, gdal_extents, modelName2Module,
     getTimeFromFile
 )
 
@@ -148,6 +148,26 @@ def test_writeArrayToRaster(tmp_path):
     assert np.allclose(band.ReadAsArray(), array)
 
 
+def test_writeArrayToRaster_noNoDataValue(tmp_path):
+    array = np.transpose(
+        np.array([np.arange(0, 10)])
+    ) * np.arange(0, 10)
+    filename = str(tmp_path / 'dummy.out')
+
+    writeArrayToRaster(array, filename, noDataValue=None)
+    dataset = gdal.Open(filename, gdal.GA_ReadOnly)
+    band = dataset.GetRasterBand(1)
+
+    assert band.GetNoDataValue() is None
+    band = None
+    dataset = None
+
+    # zeros are valid data and must not be masked when read back
+    out = gdal_open(filename)
+    assert not np.any(np.isnan(out))
+    assert np.allclose(out, array)
+
+
 def test_makePoints0D_cython(make_points_0d_data):
     from RAiDER.makePoints import makePoints0D
 
@@ -206,6 +226,16 @@ def test_makeDelayFileNames():
     )
 
 
+def test_makeHeightLevelFileName():
+    assert makeHeightLevelFileName("dir/ERA5_wet_01_02_03_ztd.h5") == \
+        "dir/ERA5_delays_01_02_03_ztd.h5"
+
+
+def test_makeHeightLevelFileName_wet_directory():
+    assert makeHeightLevelFileName("wet_runs/ERA5_wet_ztd.h5") == \
+        "wet_runs/ERA5_delays_ztd.h5"
+
+
 def test_least_nonzero():
     a = np.arange(20, dtype="float64").reshape(2, 2, 5)
     a[0, 0, 0] = np.nan
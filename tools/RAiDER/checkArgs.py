@@ -18,6 +18,9 @@ from RAiDER.constants import Zenith
 from RAiDER.llreader import readLL
 from RAiDER.utilFcns import makeDelayFileNames, modelName2Module
 
+# weather models that are read from user-supplied files rather than downloaded
+_FILE_MODELS = frozenset({'WRF', 'HDF5'})
+
 
 def checkArgs(args, p):
     '''
@@ -62,7 +65,7 @@ def checkArgs(args, p):
                 please contribute!
                 '''.format(args.model))
         )
-    if args.model in ['WRF', 'HDF5'] and args.files is None:
+    if args.model in _FILE_MODELS and args.files is None:
         raise RuntimeError(
             'Argument --files is required with model {}'.format(args.model)
         )
@@ -111,6 +114,10 @@ def checkArgs(args, p):
     else:
         outformat = args.outformat.lower()
 
+    # Parse the station file once; it is copied to the output for each date
+    if flag == 'station_file':
+        indf = pd.read_csv(args.query_area)
+
     wetNames, hydroNames = [], []
     for time in datetimeList:
         if flag == 'station_file':
@@ -126,7 +133,6 @@ def checkArgs(args, p):
             hydroFilename = wetFilename
 
             # copy the input file to the output location for editing
-            indf = pd.read_csv(args.query_area)
             indf.to_csv(wetFilename, index=False)
         else:
             wetFilename, hydroFilename = makeDelayFileNames(
@@ -146,11 +152,10 @@ def checkArgs(args, p):
     elif args.heightlvs is not None:
         heights = ('lvs', args.heightlvs)
     elif flag == 'station_file':
-        indf = pd.read_csv(args.query_area)
-        try:
-            hgts = indf['Hgt_m'].values
+        # The station file was already parsed above; only its columns matter here
+        if 'Hgt_m' in indf.columns:
             heights = ('pandas', wetNames)
-        except:
+        else:
             heights = ('merge', wetNames)
     elif useWeatherNodes:
         heights = ('skip', None)
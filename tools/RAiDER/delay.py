@@ -20,7 +20,7 @@ from RAiDER.logger import *
 from RAiDER.losreader import getLookVectors
 from RAiDER.processWM import prepareWeatherModel
 from RAiDER.utilFcns import (
-    writeDelays, writePnts2HDF5
+    makeHeightLevelFileName, writeDelays, writePnts2HDF5
 )
 
 
@@ -191,8 +191,12 @@ def tropo_delay(args):
         out=out,
     )
 
+    if not isinstance(wetFilename, str):
+        wetFilename = wetFilename[0]
+        hydroFilename = hydroFilename[0]
+
     if heights[0] == 'lvs':
-        outName = wetFilename[0].replace('wet', 'delays')
+        outName = makeHeightLevelFileName(wetFilename)
         writeDelays(flag, wetDelay, hydroDelay, lats, lons,
                     outName, zlevels=hgts, outformat=outformat, delayType=delayType)
         logger.info('Finished writing data to %s', outName)
@@ -204,10 +208,6 @@ def tropo_delay(args):
         )
 
     else:
-        if not isinstance(wetFilename, str):
-            wetFilename = wetFilename[0]
-            hydroFilename = hydroFilename[0]
-
         writeDelays(flag, wetDelay, hydroDelay, lats, lons,
                     wetFilename, hydroFilename, outformat=outformat,
                     proj=None, gt=None, ndv=0.)
@@ -8,10 +8,11 @@
 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
 import argparse
 import itertools
-import multiprocessing
 import os
 import pandas as pd
 import requests
+import threading
+from multiprocessing.pool import ThreadPool
 from textwrap import dedent
 
 from RAiDER.cli.parser import add_cpus, add_out, add_verbose
@@ -23,6 +24,9 @@ from RAiDER.utilFcns import requests_retry_session
 # base URL for UNR repository
 _UNR_URL = "http://geodesy.unr.edu/"
 
+# per-thread HTTP session, reused across archive queries; see _get_session
+_THREAD_LOCAL = threading.local()
+
 
 def create_parser():
     """Parse command line arguments using argparse."""
@@ -185,16 +189,26 @@ def download_tropo_delays(stats, years, gps_repo=None, writeDir='.', numCPUs=8,
         raise TypeError('stats should be a string or a list of strings')
     if not isinstance(years, (list, int)):
         raise TypeError('years should be an int or a list of ints')
+    if isinstance(stats, str):
+        stats = [stats]
+    if isinstance(years, int):
+        years = [years]
+
+    # Drop repeated stations/years (order-preserving) so that each archive
+    # file is only queried once
+    stats = list(dict.fromkeys(stats))
+    years = list(dict.fromkeys(years))
 
     # Iterate over stations and years and check or download data
     stat_year_tup = itertools.product(stats, years)
     stat_year_tup = ((*tup, writeDir, download) for tup in stat_year_tup)
-    # Parallelize remote querying of station locations
-    with multiprocessing.Pool(numCPUs) as multipool:
+    # Parallelize remote querying of station locations. The queries are
+    # network-bound, so threads avoid the cost of spawning processes
+    with ThreadPool(numCPUs) as pool:
         # only record valid path
         if gps_repo == 'UNR':
             results = [
-                fileurl for fileurl in multipool.starmap(download_UNR, stat_year_tup)
+                fileurl for fileurl in pool.starmap(download_UNR, stat_year_tup)
                 if fileurl['path']
             ]
 
@@ -228,18 +242,19 @@ def download_url(url, save_path, chunk_size=2048):
     Download a file from a URL. Modified from
     https://stackoverflow.com/questions/9419162/download-returned-zip-file-from-url
     '''
-    session = requests_retry_session()
-    r = session.get(url, stream=True)
+    session = _get_session()
 
-    if r.status_code == 404:
-        return ''
-    else:
-        logger.debug('Beginning download of %s to %s', url, save_path)
-        with open(save_path, 'wb') as fd:
-            for chunk in r.iter_content(chunk_size=chunk_size):
-                fd.write(chunk)
-        logger.debug('Completed download of %s to %s', url, save_path)
-        return save_path
+    # Close the streamed response so its connection goes back to the session
+    with session.get(url, stream=True) as r:
+        if r.status_code == 404:
+            return ''
+        else:
+            logger.debug('Beginning download of %s to %s', url, save_path)
+            with open(save_path, 'wb') as fd:
+                for chunk in r.iter_content(chunk_size=chunk_size):
+                    fd.write(chunk)
+            logger.debug('Completed download of %s to %s', url, save_path)
+            return save_path
 
 
 def check_url(url):
@@ -247,13 +262,25 @@ def check_url(url):
     Check whether a file exists at a URL. Modified from
     https://stackoverflow.com/questions/9419162/download-returned-zip-file-from-url
     '''
-    session = requests_retry_session()
+    session = _get_session()
     r = session.head(url)
     if r.status_code == 404:
         url = ''
     return url
 
 
+def _get_session():
+    '''
+    Return the retrying requests session for the calling thread, creating it
+    on first use so that connections are kept alive across queries
+    '''
+    session = getattr(_THREAD_LOCAL, 'session', None)
+    if session is None:
+        session = requests_retry_session()
+        _THREAD_LOCAL.session = session
+    return session
+
+
 def read_text_file(filename):
     '''
     Read a list of GNSS station names from a plain text file
@@ -354,7 +381,8 @@ def query_repos(
     # iterate over years
     years = list(set([i.year for i in dateList]))
     download_tropo_delays(
-        stats, years, gps_repo=gps_repo, writeDir=out, download=download
+        stats, years, gps_repo=gps_repo, writeDir=out, numCPUs=cpus,
+        download=download
     )
 
     # Add lat/lon info
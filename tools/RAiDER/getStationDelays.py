@@ -60,54 +60,61 @@ def get_delays_UNR(stationFile, filename, dateList, returnTime=None):
     stationTarlist = ziprepo.namelist()
     stationTarlist.sort()
 
+    # every file in the archive is checked against the dates, so use a set
+    dateSet = set(dateList)
+
     final_stationTarlist = []
     for j in stationTarlist:
         # get the date of the file
         time, yearFromFile, doyFromFile = get_date(os.path.basename(j).split('.'))
         # check if in list of specified input dates
-        if time.strftime('%Y-%m-%d') not in dateList:
+        if time.strftime('%Y-%m-%d') not in dateSet:
             continue
         final_stationTarlist.append(j)
         f = gzip.open(ziprepo.open(j), 'rb')
         # initialize variables
         d, Sig, dwet, dhydro, timesList = [], [], [], [], []
-        flag = False
-        for line in f.readlines():
+        # Skip ahead to the TROP/SOLUTION block and stop reading at its end,
+        # so that each line is visited once and only data lines are parsed
+        in_solution = False
+        for line in f:
             try:
                 line = line.decode('utf-8')
             except UnicodeDecodeError:
                 line = line.decode('latin-1')
-            if flag:
-                # Do not attempt to read header
-                if 'SITE' in line:
-                    continue
-                # Attempt to read data
-                try:
-                    split_lines = line.split()
-                    # units: mm, mm, mm, deg, deg, deg, deg, mm, mm, K
-                    trotot, trototSD, trwet, tgetot, tgetotSD, tgntot, tgntotSD, wvapor, wvaporSD, mtemp = \
-                        [float(t) for t in split_lines[2:]]
-                except:
-                    continue
-                site = split_lines[0]
-                year, doy, seconds = [int(n)
-                                      for n in split_lines[1].split(':')]
-                # Break iteration if time from line in file does not match date reported in filename
-                if doy != doyFromFile:
-                    logger.warning(
-                        'time %s from line in conflict with time %s from file '
-                        '%s, will continue reading next tarfile(s)',
-                        doy, doyFromFile, j
-                    )
-                    continue
-                # convert units from mm to m
-                d.append(trotot * 0.001)
-                Sig.append(trototSD * 0.001)
-                dwet.append(trwet * 0.001)
-                dhydro.append((trotot - trwet) * 0.001)
-                timesList.append(seconds)
-            if 'TROP/SOLUTION' in line:
-                flag = True
+            if not in_solution:
+                in_solution = 'TROP/SOLUTION' in line
+                continue
+            if line.startswith('-TROP/SOLUTION'):
+                break
+            # Do not attempt to read header
+            if 'SITE' in line:
+                continue
+            # Attempt to read data
+            try:
+                split_lines = line.split()
+                # units: mm, mm, mm, deg, deg, deg, deg, mm, mm, K
+                trotot, trototSD, trwet, tgetot, tgetotSD, tgntot, tgntotSD, wvapor, wvaporSD, mtemp = \
+                    [float(t) for t in split_lines[2:]]
+            except:
+                continue
+            site = split_lines[0]
+            year, doy, seconds = [int(n)
+                                  for n in split_lines[1].split(':')]
+            # Break iteration if time from line in file does not match date reported in filename
+            if doy != doyFromFile:
+                logger.warning(
+                    'time %s from line in conflict with time %s from file '
+                    '%s, will continue reading next tarfile(s)',
+                    doy, doyFromFile, j
+                )
+                continue
+            # convert units from mm to m
+            d.append(trotot * 0.001)
+            Sig.append(trototSD * 0.001)
+            dwet.append(trwet * 0.001)
+            dhydro.append((trotot - trwet) * 0.001)
+            timesList.append(seconds)
         del f
         # Break iteration if file contains no data.
         if d == []:
@@ -120,10 +127,12 @@ def get_delays_UNR(stationFile, filename, dateList, returnTime=None):
         # check for missing times
         true_times = list(range(0, 86400, 300))
         if len(timesList) != len(true_times):
-            missing = [
-                True if t not in timesList else False for t in true_times]
+            observed = set(timesList)
+            missing = [t not in observed for t in true_times]
             mask = np.array(missing)
-            delay, sig, wet_delay, hydro_delay = [np.full((288,), np.nan)] * 4
+            # one block with a row per output; a list of the same array repeated
+            # four times would make all of the outputs alias each other
+            delay, sig, wet_delay, hydro_delay = np.full((4, len(true_times)), np.nan)
             delay[~mask] = d
             sig[~mask] = Sig
             wet_delay[~mask] = dwet
@@ -140,13 +149,13 @@ def get_delays_UNR(stationFile, filename, dateList, returnTime=None):
         if returnTime == None:
             filtoutput = {'ID': [site] * len(wet_delay), 'Date': [time] * len(wet_delay), 'ZTD': delay, 'wet_delay': wet_delay,
                           'hydrostatic_delay': hydro_delay, 'times': times, 'sigZTD': sig}
-            filtoutput = [{key: value[k] for key, value in filtoutput.items()}
-                          for k in range(len(filtoutput['ID']))]
         else:
             index = np.argmin(np.abs(np.array(timesList) - returnTime))
             filtoutput = [{'ID': site, 'Date': time, 'ZTD': delay[index], 'wet_delay': wet_delay[index],
                            'hydrostatic_delay': hydro_delay[index], 'times': times[index], 'sigZTD': sig[index]}]
         # setup pandas array and write output to CSV, making sure to update existing CSV.
+        # A dict of columns is passed straight through, without building a
+        # dict per row first
         filtoutput = pd.DataFrame(filtoutput)
         if not os.path.exists(filename):
             filtoutput.to_csv(filename, index=False)
@@ -10,6 +10,9 @@ import pandas as pd
 
 from textwrap import dedent
 
+# datetime stamp embedded in RAiDER delay filenames, e.g. 20200103T230000
+_DATETIME_RE = re.compile(r'\d{8}T\d{6}')
+
 
 def combineDelayFiles(outName, loc=os.getcwd(), ext='.csv'):
     files = glob.glob(os.path.join(loc, '*' + ext))
@@ -56,8 +59,7 @@ def addDateTimeToFiles(fileList, force=False):
 def getDateTime(filename):
     ''' Parse a datetime from a RAiDER delay filename '''
     filename = os.path.basename(filename)
-    dtr = re.compile(r'\d{8}T\d{6}')
-    dt = dtr.search(filename)
+    dt = _DATETIME_RE.search(filename)
     return datetime.datetime.strptime(
             dt.group(), 
             '%Y%m%dT%H%M%S'
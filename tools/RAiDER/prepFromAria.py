@@ -61,14 +61,23 @@ def makeLatLonGrid(inFile, lonFileName, latFileName, fmt='ENVI'):
     xStep = gt[1]
     yStep = gt[-1]
 
-    xEnd = xStart + xStep * xSize - xStep
-    yEnd = yStart + yStep * ySize - yStep
-
-    x = np.arange(xStart, xEnd, xStep)
-    y = np.arange(yStart, yEnd, yStep)
-    X, Y = np.meshgrid(x, y)
-    writeArrayToRaster(X, lonFileName, 0., fmt, proj, gt)
-    writeArrayToRaster(Y, latFileName, 0., fmt, proj, gt)
+    # Build the coordinates from the pixel count rather than np.arange with a
+    # float step, whose length depends on rounding and excludes the last pixel.
+    # As before, each value is the upper-left corner of its pixel.
+    x = xStart + xStep * np.arange(xSize)
+    y = yStart + yStep * np.arange(ySize)
+    shape = (ySize, xSize)
+
+    # Expand one coordinate at a time so that only a single full grid is held
+    # in memory. GDAL needs a contiguous buffer, so copy the broadcast view.
+    # Every pixel holds a valid coordinate (0 is a real lat/lon), so the grids
+    # are written without a NoData value.
+    X = np.ascontiguousarray(np.broadcast_to(x[np.newaxis, :], shape))
+    writeArrayToRaster(X, lonFileName, None, fmt, proj, gt)
+    del X
+
+    Y = np.ascontiguousarray(np.broadcast_to(y[:, np.newaxis], shape))
+    writeArrayToRaster(Y, latFileName, None, fmt, proj, gt)
 
 
 def makeLOSFile(incFile, azFile, fmt='ENVI', filename='los.rdr'):
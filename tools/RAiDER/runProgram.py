@@ -1,16 +1,15 @@
 import argparse
 from textwrap import dedent
 
-from RAiDER.checkArgs import checkArgs
 from RAiDER.cli.parser import add_bbox, add_out, add_verbose
 from RAiDER.cli.validators import DateListAction, date_type, time_type
 from RAiDER.constants import _ZREF
-from RAiDER.delay import tropo_delay, weather_model_debug
 from RAiDER.logger import *
 from RAiDER.models.allowed import ALLOWED_MODELS
+import itertools
 import multiprocessing
+import os
 import numpy as np
-import copy
 
 
 def create_parser():
@@ -121,7 +120,7 @@ def create_parser():
         default=_ZREF)
     misc.add_argument(
         '--parallel', '-p',
-        help='Number of parallel delays computations or weather model downloads (with download_only enabled) that are ran concurrently  (default:  1)',
+        help='Number of weather model downloads that are run concurrently; delays are then computed one date at a time, skipping dates whose weather model could not be downloaded (default:  1)',
         type=int,
         default=1)
     misc.add_argument(
@@ -150,6 +149,10 @@ def parseCMD():
     p = create_parser()
     args = p.parse_args()
 
+    # Defer the heavy imports until argparse has accepted the arguments, so
+    # that -h and argument errors return immediately
+    from RAiDER.checkArgs import checkArgs
+
     # Argument checking
     args = checkArgs(args, p)
 
@@ -173,7 +176,9 @@ def parseCMD():
         if chunk.size == 0:
             continue
         times, wetFilenames, hydroFilenames = chunk.transpose()
-        args_copy = copy.deepcopy(args)
+        # Only the per-date entries are replaced, so a shallow copy is enough
+        # and avoids duplicating the lat/lon arrays for every chunk
+        args_copy = dict(args)
         args_copy['times'] = times.tolist()
         args_copy['wetFilenames'] = wetFilenames.tolist()
         args_copy['hydroFilenames'] = hydroFilenames.tolist()
@@ -181,26 +186,82 @@ def parseCMD():
 
     # multi-processing approach
     if not args['parallel'] == 1:
-        if not args['download_only']:
-            raise RuntimeError('Cannot process multiple delay calculations in parallel,' \
-                               ' either specify --download_only or set parallel = 1')
+        # The weather model downloads for each date are independent, so fetch
+        # them concurrently. The delay calculations share the query points
+        # file, so they are run in the regular for-loop below and pick up the
+        # already-downloaded weather models.
+        download_args = [dict(a, download_only=True) for a in lst_new_args]
 
         # split the args across the number of concurrent jobs
-        Nprocs = len(lst_new_args)
+        Nprocs = len(download_args)
         with multiprocessing.Pool(Nprocs) as pool:
-            pool.map(_tropo_delay, lst_new_args)
+            failed = pool.map(_download_weather_models, download_args)
 
-    # Otherwise a regular for-loop
-    else:
-        for new_args in lst_new_args:
-            _tropo_delay(new_args)
+        if args['download_only']:
+            return
+
+        # Dates whose download failed have already been logged, so do not
+        # retry them in the delay calculation
+        failed = set(itertools.chain.from_iterable(failed))
+        lst_new_args = [_drop_times(a, failed) for a in lst_new_args]
+
+    for new_args in lst_new_args:
+        _tropo_delay(new_args)
 
     return
 
 
+def _drop_times(args, times):
+    '''
+    Return a copy of a chunk of arguments without the given datetimes
+    '''
+    keep = [k for k, tim in enumerate(args['times']) if tim not in times]
+    args_copy = dict(args)
+    for key in ('times', 'wetFilenames', 'hydroFilenames'):
+        args_copy[key] = [args[key][k] for k in keep]
+    return args_copy
+
+
+def _download_weather_models(args):
+    '''
+    Download the weather model for each datetime in a chunk of arguments and
+    return the datetimes whose download failed
+    '''
+    from RAiDER.delay import tropo_delay
+
+    args_copy = dict(args, download_only=True)
+    failed = []
+
+    for tim in args['times']:
+        args_copy['times'] = tim
+        try:
+            tropo_delay(args_copy)
+        except Exception:
+            # The weather model APIs raise their own exception types, and one
+            # bad date must not abort the downloads of all the others
+            logger.exception("Download for date %s failed", tim)
+            failed.append(tim)
+            continue
+
+        # Some weather models log and swallow their download errors, so also
+        # check that the file was actually written
+        wm_file = args_copy['weather_model']['type'].files[0]
+        if not os.path.exists(wm_file):
+            logger.error("Download for date %s failed, %s was not written", tim, wm_file)
+            failed.append(tim)
+
+    return failed
+
+
 def _tropo_delay(args):
+    '''
+    Run tropo_delay for each datetime in a chunk of arguments and return
+    the datetimes that failed
+    '''
+    from RAiDER.delay import tropo_delay
 
-    args_copy = copy.deepcopy(args)
+    args_copy = dict(args)
+    failed = []
 
     if 0 < len(args['times']) < 2:
         args_copy['times'] = args['times'][0]
@@ -208,6 +269,7 @@ def _tropo_delay(args):
             (_, _) = tropo_delay(args_copy)
         except RuntimeError:
             logger.exception("Date %s failed", args_copy['times'])
+            failed.append(args_copy['times'])
     else:
         for tim, wetFilename, hydroFilename in zip(args['times'], args['wetFilenames'], args['hydroFilenames']):
             try:
@@ -217,8 +279,11 @@ def _tropo_delay(args):
                 (_, _) = tropo_delay(args_copy)
             except RuntimeError:
                 logger.exception("Date %s failed", tim)
+                failed.append(tim)
                 continue
 
+    return failed
+
 
 def parseCMD_weather_model_debug():
     """
@@ -229,6 +294,9 @@ def parseCMD_weather_model_debug():
     p = create_parser()
     args = p.parse_args()
 
+    from RAiDER.checkArgs import checkArgs
+    from RAiDER.delay import weather_model_debug
+
     # Argument checking
     los, lats, lons, ll_bounds, heights, flag, weather_model, wmLoc, zref, outformat, \
         times, out, download_only, verbose, \
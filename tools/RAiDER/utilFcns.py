@@ -17,6 +17,9 @@ from RAiDER.logger import *
 
 gdal.UseExceptions()
 
+# datetime stamp embedded in weather model filenames, e.g. 2020_01_03_T23_00_00
+_FILE_DATETIME_RE = re.compile(r'\d{4}_\d{2}_\d{2}_T\d{2}_\d{2}_\d{2}')
+
 
 def sind(x):
     """Return the sine of x when x is in degrees."""
@@ -130,7 +133,8 @@ def writeResultsToHDF5(lats, lons, hgts, wet, hydro, filename, delayType=None):
 
 def writeArrayToRaster(array, filename, noDataValue=0., fmt='ENVI', proj=None, gt=None):
     '''
-    write a numpy array to a GDAL-readable raster
+    write a numpy array to a GDAL-readable raster. Pass noDataValue=None
+    to write the raster without a NoData value
     '''
     array_shp = np.shape(array)
     if array.ndim != 2:
@@ -151,7 +155,8 @@ def writeArrayToRaster(array, filename, noDataValue=0., fmt='ENVI', proj=None, g
         ds.SetGeoTransform(gt)
     b1 = ds.GetRasterBand(1)
     b1.WriteArray(array)
-    b1.SetNoDataValue(noDataValue)
+    if noDataValue is not None:
+        b1.SetNoDataValue(noDataValue)
     ds = None
     b1 = None
 
@@ -283,6 +288,20 @@ def makeDelayFileNames(time, los, outformat, weather_model_name, out):
     return wet_file_name, hydro_file_name
 
 
+def makeHeightLevelFileName(wetFilename):
+    '''
+    return the name of the combined delay file written for height levels,
+    derived from the wet delay file name. Only the first 'wet' in the file
+    name itself is replaced.
+
+    # Examples:
+    >>> makeHeightLevelFileName("some_dir/model_name_wet_ztd.h5")
+    'some_dir/model_name_delays_ztd.h5'
+    '''
+    outDir, wetName = os.path.split(wetFilename)
+    return os.path.join(outDir, wetName.replace('wet', 'delays', 1))
+
+
 def checkShapes(los, lats, lons, hts):
     '''
     Make sure that by the time the code reaches here, we have a
@@ -398,9 +417,8 @@ def getTimeFromFile(filename):
     Parse a filename to get a date-time
     '''
     fmt = '%Y_%m_%d_T%H_%M_%S'
-    p = re.compile(r'\d{4}_\d{2}_\d{2}_T\d{2}_\d{2}_\d{2}')
     try:
-        out = p.search(filename).group()
+        out = _FILE_DATETIME_RE.search(filename).group()
         return datetime.strptime(out, fmt)
     except:
         raise RuntimeError('The filename for {} does not include a datetime in the correct format'.format(filename))